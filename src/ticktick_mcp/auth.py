@@ -8,9 +8,14 @@ Refactored to support 'headless' MCP operation.
 import os
 import json
 import base64
+import secrets
 import urllib.parse
 import requests
 import threading
+import time
+from functools import lru_cache
+from typing import NamedTuple, Optional
+from requests.adapters import HTTPAdapter
 from http.server import BaseHTTPRequestHandler, HTTPServer
 from pathlib import Path
 
@@ -19,6 +24,10 @@ PROJECT_ROOT = PACKAGE_ROOT.parent
 TOKEN_FILE = PROJECT_ROOT / ".ticktick_token.json"
 
 DEFAULT_SCOPES = ["tasks:read", "tasks:write"]
+_SCOPE_STR = " ".join(DEFAULT_SCOPES)
+
+# Treat tokens as expired slightly early so in-flight requests don't race expiry
+TOKEN_EXPIRY_MARGIN = 30
 
 VERSION_CONFIGS = {
     "global": {
@@ -36,10 +45,75 @@ VERSION_CONFIGS = {
 }
 
 
+_SUCCESS_HTML_BYTES = """
+    <html>
+    <head>
+        <title>Login Successful</title>
+        <style>
+            body { font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, Helvetica, Arial, sans-serif; text-align: center; padding: 50px; background-color: #f5f5f7; color: #1d1d1f; }
+            .container { background: white; padding: 40px; border-radius: 12px; box-shadow: 0 4px 6px rgba(0,0,0,0.1); max-width: 500px; margin: 0 auto; }
+            h1 { color: #2ecc71; margin-bottom: 10px; }
+            p { font-size: 18px; line-height: 1.5; color: #86868b; }
+            .icon { font-size: 64px; margin-bottom: 20px; display: block; }
+        </style>
+    </head>
+    <body>
+        <div class="container">
+            <span class="icon">✅</span>
+            <h1>Authentication Successful!</h1>
+            <p>TickTick has been connected successfully.</p>
+            <p>You can now close this window and return to your AI agent.</p>
+        </div>
+        <script>window.close();</script>
+    </body>
+    </html>
+""".encode("utf-8")
+
+_FAIL_HTML_BYTES = b"""
+    <html><body><h1>Authentication Failed</h1><p>Could not exchange code for token. Please check logs.</p></body></html>
+"""
+
+
+class EnvConfig(NamedTuple):
+    """TickTick settings resolved from the environment."""
+
+    account_type: str
+    client_id: Optional[str]
+    client_secret: Optional[str]
+    redirect_uri: str
+    config: dict
+
+
+@lru_cache(maxsize=1)
+def _load_env_config() -> EnvConfig:
+    """Read and validate the TickTick environment variables once per process."""
+    account_type = os.getenv("TICKTICK_ACCOUNT_TYPE", "global").lower()
+    if account_type not in VERSION_CONFIGS:
+        account_type = "global"
+
+    return EnvConfig(
+        account_type=account_type,
+        client_id=os.getenv("TICKTICK_CLIENT_ID"),
+        client_secret=os.getenv("TICKTICK_CLIENT_SECRET"),
+        redirect_uri=os.getenv(
+            "TICKTICK_REDIRECT_URI", "http://localhost:8000/callback"
+        ),
+        config=VERSION_CONFIGS[account_type],
+    )
+
+
 class OAuthCallbackHandler(BaseHTTPRequestHandler):
     """Handles the OAuth callback from the browser."""
 
     def do_GET(self):
+        # Cheap string checks first so stray requests (favicon, probes) skip parsing
+        if not self.path.startswith(self.server.callback_path) or (
+            "code=" not in self.path
+        ):
+            self.send_response(404)
+            self.end_headers()
+            return
+
         parsed_path = urllib.parse.urlparse(self.path)
         query_params = urllib.parse.parse_qs(parsed_path.query)
 
@@ -48,39 +122,16 @@ class OAuthCallbackHandler(BaseHTTPRequestHandler):
 
             success = self.server.auth_instance.exchange_code(code)
 
+            body = _SUCCESS_HTML_BYTES if success else _FAIL_HTML_BYTES
+
             self.send_response(200)
             self.send_header("Content-type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
             self.end_headers()
+            self.wfile.write(body)
 
             if success:
-                html_content = """
-                    <html>
-                    <head>
-                        <title>Login Successful</title>
-                        <style>
-                            body { font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, Helvetica, Arial, sans-serif; text-align: center; padding: 50px; background-color: #f5f5f7; color: #1d1d1f; }
-                            .container { background: white; padding: 40px; border-radius: 12px; box-shadow: 0 4px 6px rgba(0,0,0,0.1); max-width: 500px; margin: 0 auto; }
-                            h1 { color: #2ecc71; margin-bottom: 10px; }
-                            p { font-size: 18px; line-height: 1.5; color: #86868b; }
-                            .icon { font-size: 64px; margin-bottom: 20px; display: block; }
-                        </style>
-                    </head>
-                    <body>
-                        <div class="container">
-                            <span class="icon">✅</span>
-                            <h1>Authentication Successful!</h1>
-                            <p>TickTick has been connected successfully.</p>
-                            <p>You can now close this window and return to your AI agent.</p>
-                        </div>
-                        <script>window.close();</script>
-                    </body>
-                    </html>
-                """
-                self.wfile.write(html_content.encode("utf-8"))
-            else:
-                self.wfile.write(b"""
-                    <html><body><h1>Authentication Failed</h1><p>Could not exchange code for token. Please check logs.</p></body></html>
-                """)
+                self.server.auth_instance.stop_local_server()
         else:
             self.send_response(404)
             self.end_headers()
@@ -93,31 +144,74 @@ class TickTickAuth:
     """TickTick OAuth authentication manager."""
 
     def __init__(self):
-        self.account_type = os.getenv("TICKTICK_ACCOUNT_TYPE", "global").lower()
-        if self.account_type not in VERSION_CONFIGS:
-            self.account_type = "global"
-
-        self.config = VERSION_CONFIGS[self.account_type]
+        env = _load_env_config()
+        self.account_type = env.account_type
+        self.config = env.config
+        self.base_url = self.config["base_url"]
+        self.token_url = self.config["token_url"]
+
+        self.client_id = env.client_id
+        self.client_secret = env.client_secret
+        self.redirect_uri = env.redirect_uri
+
+        self._basic_auth_header = None
+        self._token_headers = None
+        if self.is_configured():
+            auth_str = f"{self.client_id}:{self.client_secret}"
+            auth_b64 = base64.b64encode(auth_str.encode("ascii")).decode("ascii")
+            self._basic_auth_header = f"Basic {auth_b64}"
+            self._token_headers = {
+                "Authorization": self._basic_auth_header,
+                "Content-Type": "application/x-www-form-urlencoded",
+            }
+
+        # Everything in the authorization URL except 'state' is fixed per instance
+        self._auth_url_prefix = None
+        if self.is_configured():
+            query_string = urllib.parse.urlencode(
+                {
+                    "client_id": self.client_id,
+                    "redirect_uri": self.redirect_uri,
+                    "response_type": "code",
+                    "scope": _SCOPE_STR,
+                }
+            )
+            self._auth_url_prefix = (
+                f"{self.config['auth_url']}?{query_string}&state="
+            )
 
-        self.client_id = os.getenv("TICKTICK_CLIENT_ID")
-        self.client_secret = os.getenv("TICKTICK_CLIENT_SECRET")
-        self.redirect_uri = os.getenv(
-            "TICKTICK_REDIRECT_URI", "http://localhost:8000/callback"
+        # Shared HTTP session so token exchange and API calls reuse connections
+        self.session = requests.Session()
+        self.session.mount(
+            "https://", HTTPAdapter(pool_connections=4, pool_maxsize=16)
         )
 
         self.access_token = None
+        self.token_expires_at = None
+        self._token_mtime = None
+        self._saved_token_data = None
+        self._headers_cache = {}
         self.load_token()
 
         self._server = None
         self._server_thread = None
 
+        self._exchange_lock = threading.Lock()
+        self._exchanged_code = None
+
     def is_configured(self) -> bool:
         """Check if Client ID and Secret are provided."""
         return bool(self.client_id and self.client_secret)
 
     def is_authenticated(self) -> bool:
-        """Check if we have a valid access token."""
-        return bool(self.access_token)
+        """Check if we have a valid, unexpired access token."""
+        return bool(self.access_token) and not self.is_token_expired()
+
+    def is_token_expired(self) -> bool:
+        """Check whether the stored token is past its known expiry time."""
+        return (
+            self.token_expires_at is not None and time.time() >= self.token_expires_at
+        )
 
     def start_local_server(self):
         """Start a local HTTP server to listen for OAuth callback."""
@@ -131,14 +225,38 @@ class TickTickAuth:
             HTTPServer.allow_reuse_address = True
             self._server = HTTPServer(("localhost", port), OAuthCallbackHandler)
             self._server.auth_instance = self
+            self._server.callback_path = parsed_uri.path
 
-            self._server_thread = threading.Thread(target=self._server.serve_forever)
+            # The server only lives for a single callback, so poll lazily
+            self._server_thread = threading.Thread(
+                target=self._server.serve_forever, kwargs={"poll_interval": 2.0}
+            )
             self._server_thread.daemon = True
             self._server_thread.start()
 
         except Exception as e:
             pass
 
+    def stop_local_server(self):
+        """Shut down the OAuth callback server after a successful login."""
+        server = self._server
+        server_thread = self._server_thread
+        if not server:
+            return
+
+        self._server = None
+        self._server_thread = None
+
+        def _shutdown():
+            server.shutdown()
+            server.server_close()
+            if server_thread:
+                server_thread.join()
+
+        # shutdown() waits for serve_forever() to return, so it must not run
+        # on the request handler thread that serve_forever() is blocked on.
+        threading.Thread(target=_shutdown, daemon=True).start()
+
     def get_auth_url(self) -> str:
         """Generate the authorization URL for the user."""
         if not self.is_configured():
@@ -146,15 +264,8 @@ class TickTickAuth:
                 "Missing TICKTICK_CLIENT_ID or TICKTICK_CLIENT_SECRET in environment."
             )
 
-        params = {
-            "client_id": self.client_id,
-            "redirect_uri": self.redirect_uri,
-            "response_type": "code",
-            "scope": " ".join(DEFAULT_SCOPES),
-            "state": base64.urlsafe_b64encode(os.urandom(10)).decode("utf-8"),
-        }
-        query_string = urllib.parse.urlencode(params)
-        return f"{self.config['auth_url']}?{query_string}"
+        # token_urlsafe only emits URL-safe characters, so no quoting is needed
+        return self._auth_url_prefix + secrets.token_urlsafe(10)
 
     def exchange_code(self, code: str) -> bool:
         """Exchange auth code for access token."""
@@ -165,52 +276,89 @@ class TickTickAuth:
             "grant_type": "authorization_code",
             "code": code,
             "redirect_uri": self.redirect_uri,
-            "scope": " ".join(DEFAULT_SCOPES),
+            "scope": _SCOPE_STR,
         }
 
-        auth_str = f"{self.client_id}:{self.client_secret}"
-        auth_b64 = base64.b64encode(auth_str.encode("ascii")).decode("ascii")
-        headers = {
-            "Authorization": f"Basic {auth_b64}",
-            "Content-Type": "application/x-www-form-urlencoded",
-        }
+        # The callback server and finish_authentication can race on the same
+        # code; only one exchange runs at a time and codes are single-use.
+        with self._exchange_lock:
+            if code == self._exchanged_code and self.is_authenticated():
+                return True
 
-        try:
-            response = requests.post(
-                self.config["token_url"], data=data, headers=headers
-            )
-            response.raise_for_status()
-            token_data = response.json()
+            try:
+                response = self.session.post(
+                    self.token_url, data=data, headers=self._token_headers
+                )
+                response.raise_for_status()
+                token_data = response.json()
+
+                self.save_token(token_data)
+                self._exchanged_code = code
+                return True
+            except Exception as e:
+                return False
 
-            self.save_token(token_data)
-            return True
-        except Exception as e:
-            return False
+    def _set_access_token(self, access_token):
+        """Store the access token and rebuild the cached auth headers."""
+        self.access_token = access_token
+        if access_token:
+            self._headers_cache = {"Authorization": f"Bearer {access_token}"}
+        else:
+            self._headers_cache = {}
 
     def save_token(self, token_data: dict):
-        """Save token to local file."""
+        """Save token to local file, skipping the write if nothing changed."""
+        if token_data == self._saved_token_data:
+            return
+
         try:
-            self.access_token = token_data.get("access_token")
-            with open(TOKEN_FILE, "w") as f:
+            raw_token_data = token_data
+            expires_in = token_data.get("expires_in")
+            if expires_in:
+                # Persist an absolute wall-clock expiry so restarts can restore it
+                token_data = {
+                    **token_data,
+                    "expires_at": time.time() + expires_in - TOKEN_EXPIRY_MARGIN,
+                }
+            self._set_access_token(token_data.get("access_token"))
+            self.token_expires_at = token_data.get("expires_at")
+            # Write to a sibling file and rename so readers never see a torn token
+            tmp_file = TOKEN_FILE.with_suffix(".tmp")
+            fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "w") as f:
                 json.dump(token_data, f)
+                f.flush()
+                os.fsync(f.fileno())
+            os.chmod(tmp_file, 0o600)
+            os.replace(tmp_file, TOKEN_FILE)
+            self._token_mtime = TOKEN_FILE.stat().st_mtime_ns
+            self._saved_token_data = raw_token_data
         except Exception as e:
             pass
 
     def load_token(self):
-        """Load token from local file."""
-        if TOKEN_FILE.exists():
-            try:
-                with open(TOKEN_FILE, "r") as f:
-                    data = json.load(f)
-                    self.access_token = data.get("access_token")
-            except Exception as e:
-                pass
+        """Load token from local file, skipping the read if it has not changed."""
+        try:
+            mtime = TOKEN_FILE.stat().st_mtime_ns
+        except OSError:
+            return
+
+        if mtime == self._token_mtime:
+            return
+
+        try:
+            with open(TOKEN_FILE, "r") as f:
+                data = json.load(f)
+            self._set_access_token(data.get("access_token"))
+            self.token_expires_at = data.get("expires_at")
+            self._token_mtime = mtime
+        except Exception as e:
+            pass
 
     def get_headers(self) -> dict:
         """Get headers for API requests."""
-        if not self.access_token:
-            return {}
-        return {"Authorization": f"Bearer {self.access_token}"}
+        # Copy the per-token cache so callers can't change later requests' headers
+        return dict(self._headers_cache)
 
     def get_base_url(self) -> str:
-        return self.config["base_url"]
+        return self.base_url
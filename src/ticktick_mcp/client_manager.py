@@ -13,8 +13,11 @@ ticktick = None
 
 
 def initialize_client():
-    """Initialize the TickTick client."""
+    """Initialize the TickTick client (no-op if it already exists)."""
     global ticktick
+    if ticktick is not None:
+        return True
+
     try:
         ticktick = TickTickClient()
 
@@ -1,7 +1,16 @@
 import os
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
 from datetime import datetime
+from pathlib import Path
+
+# <project root>/logs, resolved once at import
+LOG_DIR = Path(os.path.abspath(__file__)).parents[2] / "logs"
+
+_logging_configured = False
 
 def setup_logging(name: str = "ticktick_mcp"):
     """
@@ -9,7 +18,15 @@ def setup_logging(name: str = "ticktick_mcp"):
     
     - MCP_LOG_ENABLE=true: Log to logs/session_YYYYMMDD_HHMMSS.log, level INFO. No stderr.
     - Default: No logging (NullHandler).
+
+    Only the first call configures the root logger; later calls just return
+    the named logger.
     """
+    global _logging_configured
+    if _logging_configured:
+        return logging.getLogger(name)
+    _logging_configured = True
+
     # 1. Check Environment Variable
     log_enable = os.getenv("MCP_LOG_ENABLE", "").lower() == "true"
     
@@ -28,21 +45,13 @@ def setup_logging(name: str = "ticktick_mcp"):
 
     # Case B: Logging Enabled
     
-    # 2. Determine log directory
-    current_dir = os.path.dirname(os.path.abspath(__file__))
-    src_dir = os.path.dirname(current_dir)
-    pkg_dir = os.path.dirname(src_dir)
-    project_root = pkg_dir 
-    
-    log_dir = os.path.join(project_root, "logs")
-    if not os.path.exists(log_dir):
-        os.makedirs(log_dir)
+    # 2. Ensure log directory exists
+    LOG_DIR.mkdir(parents=True, exist_ok=True)
         
     # 3. Generate timestamped filename
     # Format: session_YYYYMMDD_HHMMSS.log
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    log_filename = f"session_{timestamp}.log"
-    log_file_path = os.path.join(log_dir, log_filename)
+    log_file_path = LOG_DIR / f"session_{timestamp}.log"
     
     # 4. Configure Root Logger
     root_logger.setLevel(logging.INFO)
@@ -57,7 +66,15 @@ def setup_logging(name: str = "ticktick_mcp"):
     # We do not use RotatingFileHandler because we want one file per session.
     file_handler = logging.FileHandler(log_file_path, encoding='utf-8')
     file_handler.setFormatter(formatter)
-    root_logger.addHandler(file_handler)
+
+    # Hand records to a background listener so tool calls never block on disk I/O
+    log_queue = queue.Queue(-1)
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    listener = logging.handlers.QueueListener(
+        log_queue, file_handler, respect_handler_level=True
+    )
+    listener.start()
+    atexit.register(listener.stop)
     
     # 5. Suppress noisy libraries
     logging.getLogger("urllib3").setLevel(logging.WARNING)
@@ -2,19 +2,19 @@
 Main MCP server for TickTick integration.
 """
 
+import asyncio
+
 from mcp.server.fastmcp import FastMCP
 
 from .log import setup_logging
 from .client_manager import initialize_client, get_client
-from .tools.project_tools import register_project_tools
-from .tools.task_tools import register_task_tools
-from .tools.query_tools import register_query_tools
 from .utils.logging_utils import log_interaction
 
 logger = setup_logging("server")
 mcp = FastMCP(
     "ticktick"
 )
+_tools_registered = False
 
 def register_auth_tools(mcp_server: FastMCP):
     """Register authentication related tools."""
@@ -83,19 +83,29 @@ If the automatic login fails (e.g., page connection refused), please copy the 'c
         if not client:
             return "Error: TickTick client not initialized."
 
-        if client.auth.exchange_code(code):
+        if await asyncio.to_thread(client.auth.exchange_code, code):
             return "✅ Authentication successful! Token saved locally. You can now use all task tools."
         else:
             return "❌ Authentication failed. The code might be invalid or expired. Please try 'start_authentication' again."
 
 
 def register_all_tools():
-    """Register all MCP tools from modules."""
+    """Register all MCP tools from modules (no-op after the first call)."""
+    global _tools_registered
+    if _tools_registered:
+        return
+
+    # Tool modules are only needed once the server actually starts
+    from .tools.project_tools import register_project_tools
+    from .tools.task_tools import register_task_tools
+    from .tools.query_tools import register_query_tools
+
     register_auth_tools(mcp)
 
     register_project_tools(mcp)
     register_task_tools(mcp)
     register_query_tools(mcp)
+    _tools_registered = True
 
     logger.info("All TickTick MCP tools registered successfully")
 
@@ -1,4 +1,6 @@
 import os
+import threading
+import time
 import requests
 from typing import Dict, List, Any, Optional, Union
 from .auth import TickTickAuth
@@ -10,41 +12,87 @@ class TickTickClient:
     Wraps TickTickAuth to handle token lifecycle.
     """
 
+    _STATIC_HEADERS = {
+        "Content-Type": "application/json",
+        "Accept-Encoding": None,
+        "User-Agent": "curl/8.7.1",
+    }
+
+    # Project metadata changes rarely; repeat reads within this window hit memory
+    PROJECT_CACHE_TTL = 30
+
+    # Optional task parameters and the API fields they map to
+    _TASK_FIELDS = {
+        "title": "title",
+        "content": "content",
+        "desc": "desc",
+        "start_date": "startDate",
+        "due_date": "dueDate",
+        "time_zone": "timeZone",
+        "repeat_flag": "repeatFlag",
+        "items": "items",
+    }
+
     def __init__(self):
         self.auth = TickTickAuth()
+        # Reuse the auth session so API calls share its keep-alive pool
+        self._session = self.auth.session
+        self._base_url = self.auth.get_base_url()
+        self._headers_cache = None
+        self._cached_token = None
+        self._project_cache = {}
+        # Bumped on every invalidation, so fetches that raced a write can tell
+        self._project_cache_generation = 0
+        # task ID -> project ID, learned from earlier responses. Tools call the
+        # client from worker threads, so every update holds the lock.
+        self._task_project_index = {}
+        self._task_index_lock = threading.Lock()
 
     @property
     def headers(self):
-        """Get current headers from auth module."""
-        headers = self.auth.get_headers()
-        headers.update(
-            {
-                "Content-Type": "application/json",
-                "Accept-Encoding": None,
-                "User-Agent": "curl/8.7.1",
-            }
-        )
-        return headers
+        """Get current headers, rebuilt only when the access token changes."""
+        token = self.auth.access_token
+        if self._headers_cache is None or token is not self._cached_token:
+            self._headers_cache = {**self.auth.get_headers(), **self._STATIC_HEADERS}
+            self._cached_token = token
+        return self._headers_cache
 
     @property
     def base_url(self):
-        return self.auth.get_base_url()
+        return self._base_url
 
     def _make_request(self, method: str, endpoint: str, data=None) -> Dict:
         """
         Makes a request to the TickTick API.
         """
-        if not self.auth.is_authenticated():
+        auth = self.auth
+        # An expired token may already have been replaced on disk by another
+        # login, so only give up if reloading doesn't yield a valid one.
+        if auth.access_token and auth.is_token_expired() and not self._reload_token():
+            return {
+                "error": "Access token expired or invalid. Please re-authenticate using 'start_authentication'."
+            }
+
+        if not auth.is_authenticated():
             return {
                 "error": "Not authenticated. Please use 'start_authentication' tool."
             }
 
-        url = f"{self.base_url}{endpoint}"
+        url = self._base_url + endpoint
 
         try:
-            response = requests.request(method, url, headers=self.headers, json=data)
+            for attempt in range(2):
+                response = self._session.request(
+                    method, url, headers=self.headers, json=data
+                )
+                if response.status_code != 401:
+                    break
+
+                # TickTick has no refresh grant, but a newer token may have been
+                # saved by another login since we loaded ours; retry once with it.
+                if attempt == 0 and self._reload_token():
+                    continue
 
-            if response.status_code == 401:
                 return {
                     "error": "Access token expired or invalid. Please re-authenticate using 'start_authentication'."
                 }
@@ -58,14 +106,76 @@ class TickTickClient:
         except requests.exceptions.RequestException as e:
             return {"error": str(e)}
 
+    def _reload_token(self) -> bool:
+        """Re-read the token file; return True if it yielded a different valid token."""
+        previous_token = self.auth.access_token
+        self.auth.load_token()
+        return (
+            self.auth.access_token != previous_token and self.auth.is_authenticated()
+        )
+
+    @classmethod
+    def _task_fields(cls, **params) -> Dict:
+        """Map optional task parameters to API field names, dropping empty ones."""
+        return {
+            cls._TASK_FIELDS[name]: value for name, value in params.items() if value
+        }
+
+    def _cached_get(self, endpoint: str):
+        """GET an endpoint, serving successful results from a short-lived cache."""
+        now = time.monotonic()
+        cached = self._project_cache.get(endpoint)
+        if cached and now - cached[0] < self.PROJECT_CACHE_TTL:
+            return self._copy_cached(cached[1])
+
+        generation = self._project_cache_generation
+        result = self._make_request("GET", endpoint)
+        # Don't store a response that may predate a write made during the fetch
+        if generation == self._project_cache_generation and not (
+            isinstance(result, dict) and "error" in result
+        ):
+            self._project_cache[endpoint] = (now, result)
+            return self._copy_cached(result)
+        return result
+
+    @staticmethod
+    def _copy_cached(value):
+        """Shallow-copy a cached value so callers can't mutate the cache entry."""
+        if isinstance(value, list):
+            return list(value)
+        if isinstance(value, dict):
+            return dict(value)
+        return value
+
+    def invalidate_project_cache(self):
+        """Drop cached project metadata after a project is changed."""
+        self._project_cache_generation += 1
+        self._project_cache.clear()
+
     def get_all_projects(self) -> List[Dict]:
-        return self._make_request("GET", "/project")
+        return self._cached_get("/project")
 
     def get_project(self, project_id: str) -> Dict:
-        return self._make_request("GET", f"/project/{project_id}")
+        return self._cached_get(f"/project/{project_id}")
+
+    def find_task_project(self, task_id: str) -> Optional[str]:
+        """Return the project ID last seen holding this task, if any."""
+        return self._task_project_index.get(task_id)
+
+    def _index_tasks(self, tasks: List[Dict], project_id: str):
+        """Remember which project each of these tasks belongs to."""
+        with self._task_index_lock:
+            for task in tasks:
+                if task.get("id"):
+                    self._task_project_index[task["id"]] = task.get(
+                        "projectId", project_id
+                    )
 
     def get_project_with_data(self, project_id: str) -> Dict:
-        return self._make_request("GET", f"/project/{project_id}/data")
+        result = self._make_request("GET", f"/project/{project_id}/data")
+        if "error" not in result:
+            self._index_tasks(result.get("tasks") or [], project_id)
+        return result
 
     def create_project(
         self,
@@ -75,7 +185,9 @@ class TickTickClient:
         kind: str = "TASK",
     ) -> Dict:
         data = {"name": name, "color": color, "viewMode": view_mode, "kind": kind}
-        return self._make_request("POST", "/project", data)
+        result = self._make_request("POST", "/project", data)
+        self.invalidate_project_cache()
+        return result
 
     def update_project(
         self,
@@ -94,13 +206,27 @@ class TickTickClient:
             data["viewMode"] = view_mode
         if kind:
             data["kind"] = kind
-        return self._make_request("POST", f"/project/{project_id}", data)
+        result = self._make_request("POST", f"/project/{project_id}", data)
+        self.invalidate_project_cache()
+        return result
 
     def delete_project(self, project_id: str) -> Dict:
-        return self._make_request("DELETE", f"/project/{project_id}")
+        result = self._make_request("DELETE", f"/project/{project_id}")
+        self.invalidate_project_cache()
+        with self._task_index_lock:
+            index = self._task_project_index
+            for tid in [tid for tid, pid in index.items() if pid == project_id]:
+                del index[tid]
+        return result
 
     def get_task(self, project_id: str, task_id: str) -> Dict:
-        return self._make_request("GET", f"/project/{project_id}/task/{task_id}")
+        result = self._make_request("GET", f"/project/{project_id}/task/{task_id}")
+        if "error" in result:
+            with self._task_index_lock:
+                self._task_project_index.pop(task_id, None)
+        else:
+            self._index_tasks([result], project_id)
+        return result
 
     def create_task(
         self,
@@ -118,22 +244,19 @@ class TickTickClient:
         from .utils.validators import normalize_priority
 
         data = {"title": title, "projectId": project_id}
-        if content:
-            data["content"] = content
-        if desc:
-            data["desc"] = desc
-        if start_date:
-            data["startDate"] = start_date
-        if due_date:
-            data["dueDate"] = due_date
-        if time_zone:
-            data["timeZone"] = time_zone
+        data.update(
+            self._task_fields(
+                content=content,
+                desc=desc,
+                start_date=start_date,
+                due_date=due_date,
+                time_zone=time_zone,
+                repeat_flag=repeat_flag,
+                items=items,
+            )
+        )
         if priority is not None:
             data["priority"] = normalize_priority(priority) if priority else 0
-        if repeat_flag:
-            data["repeatFlag"] = repeat_flag
-        if items:
-            data["items"] = items
         return self._make_request("POST", "/task", data)
 
     def update_task(
@@ -153,26 +276,24 @@ class TickTickClient:
         from .utils.validators import normalize_priority
 
         data = {"id": task_id, "projectId": project_id}
-        if title:
-            data["title"] = title
-        if content:
-            data["content"] = content
-        if desc:
-            data["desc"] = desc
+        data.update(
+            self._task_fields(
+                title=title,
+                content=content,
+                desc=desc,
+                start_date=start_date,
+                due_date=due_date,
+                time_zone=time_zone,
+                repeat_flag=repeat_flag,
+            )
+        )
+        # An empty list is meaningful here: it clears the task's subtasks
+        if items is not None:
+            data["items"] = items
         if priority is not None:
             p = normalize_priority(priority)
             if p is not None:
                 data["priority"] = p
-        if start_date:
-            data["startDate"] = start_date
-        if due_date:
-            data["dueDate"] = due_date
-        if time_zone:
-            data["timeZone"] = time_zone
-        if repeat_flag:
-            data["repeatFlag"] = repeat_flag
-        if items is not None:
-            data["items"] = items
         return self._make_request("POST", f"/task/{task_id}", data)
 
     def complete_task(self, project_id: str, task_id: str) -> Dict:
@@ -181,6 +302,8 @@ class TickTickClient:
         )
 
     def delete_task(self, project_id: str, task_id: str) -> Dict:
+        with self._task_index_lock:
+            self._task_project_index.pop(task_id, None)
         return self._make_request("DELETE", f"/project/{project_id}/task/{task_id}")
 
     def create_subtask(
@@ -5,16 +5,21 @@ This module contains MCP tools for managing TickTick projects,
 including creating, reading, updating, and deleting projects.
 """
 
+import asyncio
 import logging
 from typing import Union, List
 from mcp.server.fastmcp import FastMCP
 
 from ..client_manager import ensure_client
+from ..utils.concurrency import gather_in_threads, run_coalesced
 from ..utils.formatters import format_project, format_task
 from ..utils.logging_utils import log_interaction
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of project deletions sent to the API at once
+DELETE_CONCURRENCY = 6
+
 
 def register_project_tools(mcp: FastMCP):
     """Register all project-related MCP tools."""
@@ -30,18 +35,20 @@ def register_project_tools(mcp: FastMCP):
         """
         try:
             ticktick = ensure_client()
-            projects = ticktick.get_all_projects()
+            projects = await asyncio.to_thread(ticktick.get_all_projects)
             if "error" in projects:
                 return f"Error fetching projects: {projects['error']}"
 
             if not projects:
                 return "No projects found."
 
-            result = f"Found {len(projects)} projects:\n\n"
-            for i, project in enumerate(projects, 1):
-                result += f"Project {i}:\n" + format_project(project) + "\n"
+            parts = [f"Found {len(projects)} projects:\n\n"]
+            parts.extend(
+                f"Project {i}:\n{format_project(project)}\n"
+                for i, project in enumerate(projects, 1)
+            )
 
-            return result
+            return "".join(parts)
         except Exception as e:
             # logger.error(f"Error in get_all_projects: {e}")
             return f"Error retrieving projects: {str(e)}"
@@ -69,7 +76,12 @@ def register_project_tools(mcp: FastMCP):
         """
         try:
             ticktick = ensure_client()
-            project_data = ticktick.get_project_with_data(project_id)
+            # Concurrent requests for the same project share one API round trip
+            project_data = await run_coalesced(
+                ("get_project_with_data", project_id),
+                ticktick.get_project_with_data,
+                project_id,
+            )
             if "error" in project_data:
                 return f"Error fetching project data: {project_data['error']}"
 
@@ -77,23 +89,26 @@ def register_project_tools(mcp: FastMCP):
             tasks = project_data.get("tasks", [])
             project_name = project.get("name", project_id)
 
-            result = "=" * 60 + "\n"
-            result += "📁 PROJECT INFORMATION\n"
-            result += "=" * 60 + "\n\n"
-            result += format_project(project)
-            result += "\n" + "=" * 60 + "\n"
-            result += f"📋 TASKS IN '{project_name}' ({len(tasks)} tasks)\n"
-            result += "=" * 60 + "\n\n"
+            separator = "=" * 60
+            parts = [
+                f"{separator}\n📁 PROJECT INFORMATION\n{separator}\n\n",
+                format_project(project),
+                f"\n{separator}\n",
+                f"📋 TASKS IN '{project_name}' ({len(tasks)} tasks)\n",
+                f"{separator}\n\n",
+            ]
 
             if project_id.lower() == "inbox" and not tasks:
-                result += "Your inbox is empty. 📭 Great job staying organized!\n"
+                parts.append("Your inbox is empty. 📭 Great job staying organized!\n")
             elif not tasks:
-                result += f"No tasks found in this project.\n"
+                parts.append("No tasks found in this project.\n")
             else:
-                for i, task in enumerate(tasks, 1):
-                    result += f"Task {i}:\n" + format_task(task) + "\n"
+                parts.extend(
+                    f"Task {i}:\n{format_task(task)}\n"
+                    for i, task in enumerate(tasks, 1)
+                )
 
-            return result
+            return "".join(parts)
         except Exception as e:
             # logger.error(f"Error in get_project_info: {e}")
             return f"Error retrieving project information: {str(e)}"
@@ -116,8 +131,8 @@ def register_project_tools(mcp: FastMCP):
 
         try:
             ticktick = ensure_client()
-            project = ticktick.create_project(
-                name=name, color=color, view_mode=view_mode
+            project = await asyncio.to_thread(
+                ticktick.create_project, name=name, color=color, view_mode=view_mode
             )
 
             if "error" in project:
@@ -180,21 +195,20 @@ def register_project_tools(mcp: FastMCP):
 
         try:
             ticktick = ensure_client()
-            for i, project_id in enumerate(project_list):
-                try:
-                    result = ticktick.delete_project(project_id)
-
-                    if "error" in result:
-                        failed_projects.append(
-                            f"Project {i + 1} (ID: {project_id}): {result['error']}"
-                        )
-                    else:
-                        deleted_projects.append((i + 1, project_id))
-
-                except Exception as e:
+            results = await gather_in_threads(
+                ticktick.delete_project, project_list, DELETE_CONCURRENCY
+            )
+            for i, (project_id, result) in enumerate(zip(project_list, results)):
+                if isinstance(result, Exception):
+                    failed_projects.append(
+                        f"Project {i + 1} (ID: {project_id}): {str(result)}"
+                    )
+                elif "error" in result:
                     failed_projects.append(
-                        f"Project {i + 1} (ID: {project_id}): {str(e)}"
+                        f"Project {i + 1} (ID: {project_id}): {result['error']}"
                     )
+                else:
+                    deleted_projects.append((i + 1, project_id))
 
             if single_project:
                 if deleted_projects:
@@ -6,24 +6,125 @@ by various criteria such as due dates, priority, and search terms.
 """
 
 # import logging
-from typing import Dict, Any, Optional
+import asyncio
+from datetime import timedelta
+from functools import partial
+from typing import Callable, Dict, Any, Optional
 from mcp.server.fastmcp import FastMCP
 
 from ..client_manager import ensure_client
+from ..utils.concurrency import run_coalesced
+from ..utils.formatters import format_task
 from ..utils.validators import (
+    count_project_tasks_by_filter,
     get_project_tasks_by_filter,
+    get_task_due_date,
     is_task_due_today,
     is_task_overdue,
     is_task_due_in_days,
-    task_matches_search,
+    task_matches_search_lower,
     normalize_priority,
     PRIORITY_NAME_MAP,
 )
+from ..utils.timezone import get_user_timezone_now, get_user_timezone_today
 from ..utils.logging_utils import log_interaction
 
 # logger = logging.getLogger(__name__)
 
 
+def _build_task_filter(
+    task_id: Optional[str],
+    date_filter: Optional[str],
+    custom_days: Optional[int],
+    priority_value: Optional[int],
+    search_lower: Optional[str],
+) -> Callable[[Dict[str, Any]], bool]:
+    """
+    Build the per-task predicate for query_tasks from already-validated filters.
+
+    Filters left as None are not applied. search_lower must be lowercased.
+    """
+    # Resolve the date filter to a single predicate up front so the returned
+    # filter doesn't re-test date_filter for every task. The user's current
+    # date is looked up once and bound into it.
+    today = get_user_timezone_today()
+    if date_filter == "today":
+        date_pred = partial(is_task_due_today, today=today)
+    elif date_filter == "tomorrow":
+        date_pred = partial(is_task_due_in_days, days=1, today=today)
+    elif date_filter == "overdue":
+        date_pred = partial(is_task_overdue, now=get_user_timezone_now())
+    elif date_filter == "next_7_days":
+        # One due-date parse and a set lookup instead of seven parses
+        window = frozenset(today + timedelta(days=d) for d in range(7))
+        date_pred = lambda t: get_task_due_date(t) in window
+    elif date_filter == "custom":
+        date_pred = partial(is_task_due_in_days, days=custom_days, today=today)
+    else:
+        date_pred = None
+
+    # Only the filters actually requested become predicates, so an unused
+    # filter costs nothing per task. They are ordered cheapest first, so most
+    # tasks are rejected by a plain field comparison before the due-date and
+    # text search checks run.
+    predicates = []
+    if task_id is not None:
+        predicates.append(lambda t: t.get("id") == task_id)
+    if priority_value is not None:
+        predicates.append(lambda t: t.get("priority", 0) == priority_value)
+    if date_pred is not None:
+        predicates.append(date_pred)
+    if search_lower is not None:
+        predicates.append(lambda t: task_matches_search_lower(t, search_lower))
+
+    if not predicates:
+        return lambda t: True
+    if len(predicates) == 1:
+        return predicates[0]
+    return lambda t: all(pred(t) for pred in predicates)
+
+
+def _describe_filters(
+    task_id: Optional[str],
+    date_filter: Optional[str],
+    custom_days: Optional[int],
+    priority: Optional[str],
+    search_term: Optional[str],
+    project_name: Optional[str],
+) -> str:
+    """Describe the active query_tasks filters for result headers and messages."""
+    filter_descriptions = []
+    if task_id is not None:
+        filter_descriptions.append(f"task ID '{task_id}'")
+
+    if date_filter == "today":
+        filter_descriptions.append("due today")
+    elif date_filter == "tomorrow":
+        filter_descriptions.append("due tomorrow")
+    elif date_filter == "overdue":
+        filter_descriptions.append("overdue")
+    elif date_filter == "next_7_days":
+        filter_descriptions.append("due within next 7 days")
+    elif date_filter == "custom":
+        day_text = (
+            "today"
+            if custom_days == 0
+            else f"in {custom_days} day{'s' if custom_days != 1 else ''}"
+        )
+        filter_descriptions.append(f"due {day_text}")
+
+    if priority is not None:
+        filter_descriptions.append(f"priority {priority.capitalize()}")
+
+    if search_term is not None:
+        filter_descriptions.append(f"matching '{search_term}'")
+
+    if project_name is not None:
+        filter_descriptions.append(f"in project '{project_name}'")
+
+    return " AND ".join(filter_descriptions) if filter_descriptions else "all tasks"
+
+
 def register_query_tools(mcp: FastMCP):
     """Register all query and filtering MCP tools."""
 
@@ -36,6 +137,7 @@ def register_query_tools(mcp: FastMCP):
         custom_days: Optional[int] = None,
         priority: Optional[str] = None,
         search_term: Optional[str] = None,
+        count_only: bool = False,
     ) -> str:
         """
         Unified task query tool with flexible multi-dimensional filtering.
@@ -45,7 +147,12 @@ def register_query_tools(mcp: FastMCP):
 
         Args:
             task_id: Get a specific task by ID. When combined with project_id, uses direct API
-                    call (most efficient). When used alone, searches all tasks for matching ID.
+                    call (most efficient). When used alone and an earlier query already saw
+                    the (uncompleted) task, it is also fetched directly and the answer takes
+                    the same form as with project_id: the task itself, or a note that it does
+                    not match the filters. Otherwise all projects are searched for the ID
+                    and a per-project report is returned, so the result format depends on
+                    what earlier queries have seen.
                     Can be combined with other filters to verify task properties.
             project_id: Limit search to specific project (use "inbox" for inbox tasks).
                     When combined with task_id, enables direct API lookup.
@@ -59,6 +166,9 @@ def register_query_tools(mcp: FastMCP):
                         e.g., 0 for today, 1 for tomorrow, 3 for 3 days from now
             priority: Filter by priority level: "none", "low", "medium","high"(case-insensitive):
             search_term: Search keyword in title, content, or subtask titles (case-insensitive)
+            count_only: Return only the number of matching tasks instead of listing them.
+                    A direct task_id lookup reports "Found 1 tasks (...)" without the
+                    project count a search across all projects adds.
 
         Examples:
             query_tasks()                                            → All tasks
@@ -68,6 +178,7 @@ def register_query_tools(mcp: FastMCP):
             query_tasks(priority="high")                             → High priority tasks
             query_tasks(date_filter="today", priority="high")        → High priority tasks due today
             query_tasks(search_term="meeting")                       → Tasks containing "meeting"
+            query_tasks(date_filter="overdue", count_only=True)      → Number of overdue tasks
 
         """
         try:
@@ -104,47 +215,40 @@ def register_query_tools(mcp: FastMCP):
             if search_term is not None and not search_term.strip():
                 return "Search term cannot be empty."
 
+            search_lower = search_term.lower() if search_term is not None else None
+
             ticktick = ensure_client()
 
+            task = None
             if task_id and project_id:
-                task = ticktick.get_task(project_id, task_id)
+                task = await asyncio.to_thread(ticktick.get_task, project_id, task_id)
                 if "error" in task:
                     return f"Error fetching task: {task['error']}"
-
-                from ..utils.formatters import format_task
-
-                def single_task_filter(t: Dict[str, Any]) -> bool:
-                    if date_filter == "today":
-                        if not is_task_due_today(t):
-                            return False
-                    elif date_filter == "tomorrow":
-                        if not is_task_due_in_days(t, 1):
-                            return False
-                    elif date_filter == "overdue":
-                        if not is_task_overdue(t):
-                            return False
-                    elif date_filter == "next_7_days":
-                        week_match = False
-                        for day in range(7):
-                            if is_task_due_in_days(t, day):
-                                week_match = True
-                                break
-                        if not week_match:
-                            return False
-                    elif date_filter == "custom":
-                        if not is_task_due_in_days(t, custom_days):
-                            return False
-
-                    if priority_value is not None:
-                        if t.get("priority", 0) != priority_value:
-                            return False
-
-                    if search_term is not None:
-                        if not task_matches_search(t, search_term):
-                            return False
-
-                    return True
-
+            elif task_id:
+                # Earlier listings record which project holds each task; a hit
+                # replaces a sweep over every project with one direct lookup.
+                indexed_project_id = ticktick.find_task_project(task_id)
+                if indexed_project_id:
+                    task = await asyncio.to_thread(
+                        ticktick.get_task, indexed_project_id, task_id
+                    )
+                    # Fall back to the sweep on an empty or completed task too,
+                    # since the sweep would not list it either.
+                    if not task or "error" in task or task.get("status") == 2:
+                        task = None
+
+            if task is not None:
+                # The task was fetched by ID, so only the other filters apply
+                single_task_filter = _build_task_filter(
+                    None, date_filter, custom_days, priority_value, search_lower
+                )
+                if count_only:
+                    description = _describe_filters(
+                        task_id, date_filter, custom_days, priority, search_term, None
+                    )
+                    if not single_task_filter(task):
+                        return f"No tasks found ({description})."
+                    return f"Found 1 tasks ({description})."
                 if not single_task_filter(task):
                     filter_parts = []
                     if date_filter:
@@ -159,108 +263,71 @@ def register_query_tools(mcp: FastMCP):
                 return format_task(task)
 
             if project_id:
-                project_data = ticktick.get_project_with_data(project_id)
+                project_data = await run_coalesced(
+                    ("get_project_with_data", project_id),
+                    ticktick.get_project_with_data,
+                    project_id,
+                )
                 if "error" in project_data:
                     return f"Error fetching project data: {project_data['error']}"
 
                 projects = [project_data.get("project", {})]
                 all_tasks = project_data.get("tasks", [])
             else:
-                projects = ticktick.get_all_projects()
+                projects = await asyncio.to_thread(ticktick.get_all_projects)
                 if "error" in projects:
                     return f"Error fetching projects: {projects['error']}"
                 all_tasks = None
 
-            def combined_filter(task: Dict[str, Any]) -> bool:
-                if task_id is not None:
-                    if task.get("id") != task_id:
-                        return False
-
-                if date_filter == "today":
-                    if not is_task_due_today(task):
-                        return False
-                elif date_filter == "tomorrow":
-                    if not is_task_due_in_days(task, 1):
-                        return False
-                elif date_filter == "overdue":
-                    if not is_task_overdue(task):
-                        return False
-                elif date_filter == "next_7_days":
-                    week_match = False
-                    for day in range(7):
-                        if is_task_due_in_days(task, day):
-                            week_match = True
-                            break
-                    if not week_match:
-                        return False
-                elif date_filter == "custom":
-                    if not is_task_due_in_days(task, custom_days):
-                        return False
-
-                if priority_value is not None:
-                    if task.get("priority", 0) != priority_value:
-                        return False
-
-                if search_term is not None:
-                    if not task_matches_search(task, search_term):
-                        return False
-
-                return True
-
-            filter_descriptions = []
-            if task_id is not None:
-                filter_descriptions.append(f"task ID '{task_id}'")
-
-            if date_filter == "today":
-                filter_descriptions.append("due today")
-            elif date_filter == "tomorrow":
-                filter_descriptions.append("due tomorrow")
-            elif date_filter == "overdue":
-                filter_descriptions.append("overdue")
-            elif date_filter == "next_7_days":
-                filter_descriptions.append("due within next 7 days")
-            elif date_filter == "custom":
-                day_text = (
-                    "today"
-                    if custom_days == 0
-                    else f"in {custom_days} day{'s' if custom_days != 1 else ''}"
-                )
-                filter_descriptions.append(f"due {day_text}")
-
-            if priority is not None:
-                filter_descriptions.append(f"priority {priority.capitalize()}")
-
-            if search_term is not None:
-                filter_descriptions.append(f"matching '{search_term}'")
+            combined_filter = _build_task_filter(
+                task_id, date_filter, custom_days, priority_value, search_lower
+            )
 
+            project_name = None
             if project_id:
                 project_name = (
                     projects[0].get("name", project_id) if projects else project_id
                 )
-                filter_descriptions.append(f"in project '{project_name}'")
-
-            description = (
-                " AND ".join(filter_descriptions)
-                if filter_descriptions
-                else "all tasks"
+            description = _describe_filters(
+                task_id, date_filter, custom_days, priority, search_term, project_name
             )
 
-            if project_id and all_tasks is not None:
-                filtered_tasks = [task for task in all_tasks if combined_filter(task)]
+            if count_only:
+                if project_id and all_tasks is not None:
+                    count = sum(1 for task in all_tasks if combined_filter(task))
+                    if not count:
+                        return f"No tasks found ({description})."
+                    return f"Found {count} tasks ({description})."
+                return await asyncio.to_thread(
+                    count_project_tasks_by_filter,
+                    projects,
+                    combined_filter,
+                    description,
+                    ticktick,
+                )
 
-                if not filtered_tasks:
+            if project_id and all_tasks is not None:
+                # Filter and format in one pass; the header slot is filled in
+                # once the number of matches is known.
+                parts = [""]
+                count = 0
+                for task in all_tasks:
+                    if combined_filter(task):
+                        count += 1
+                        parts.append(f"Task {count}:\n{format_task(task)}\n")
+
+                if not count:
                     return f"No tasks found ({description})."
 
-                from ..utils.formatters import format_task
-
-                result = f"Found {len(filtered_tasks)} tasks ({description}):\n\n"
-                for i, task in enumerate(filtered_tasks, 1):
-                    result += f"Task {i}:\n" + format_task(task) + "\n"
-
-                return result
+                parts[0] = f"Found {count} tasks ({description}):\n\n"
+                return "".join(parts)
             else:
-                return get_project_tasks_by_filter(
-                    projects, combined_filter, description, ticktick
+                return await asyncio.to_thread(
+                    get_project_tasks_by_filter,
+                    projects,
+                    combined_filter,
+                    description,
+                    ticktick,
                 )
 
         except Exception as e:
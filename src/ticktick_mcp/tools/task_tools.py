@@ -11,26 +11,62 @@ Time handling:
 """
 
 import logging
+import os
 from typing import List, Dict, Any, Union
-from datetime import datetime
 from mcp.server.fastmcp import FastMCP
 
 from ..client_manager import ensure_client
+from ..utils.concurrency import gather_in_threads
 from ..utils.formatters import format_task
-from ..utils.timezone import normalize_iso_date, to_ticktick_date_format
+from ..utils.timezone import to_ticktick_date_format
 from ..utils.logging_utils import log_interaction
 from ..utils.validators import (
-    validate_task_data,
+    validate_task_data_batch,
     normalize_priority,
-    validate_priority,
     normalize_batch_input,
-    validate_required_fields,
+    make_validator,
     get_effective_timezone,
     format_batch_result,
 )
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_TASK_CONCURRENCY = 8
+
+
+def _read_task_concurrency() -> int:
+    """Read TICKTICK_CONCURRENCY, falling back to the default if it is invalid."""
+    raw_value = os.getenv("TICKTICK_CONCURRENCY")
+    if raw_value is None:
+        return DEFAULT_TASK_CONCURRENCY
+    try:
+        value = int(raw_value)
+    except ValueError:
+        logger.warning(
+            "Invalid TICKTICK_CONCURRENCY %r (not an integer); using %d",
+            raw_value,
+            DEFAULT_TASK_CONCURRENCY,
+        )
+        return DEFAULT_TASK_CONCURRENCY
+    if value < 1:
+        # A zero or negative limit would block every batch call forever
+        logger.warning("Invalid TICKTICK_CONCURRENCY %d (must be >= 1); using 1", value)
+        return 1
+    return value
+
+
+# Maximum number of per-task API calls a batch tool keeps in flight
+TASK_CONCURRENCY = _read_task_concurrency()
+
+# Per-tool item validators, specialized once for each tool's fields
+_validate_task_ref = make_validator(["task_id", "project_id"])
+_validate_task_update = make_validator(
+    ["task_id", "project_id"], check_priority=True, check_dates=True
+)
+_validate_subtask = make_validator(
+    ["subtask_title", "parent_task_id", "project_id"], "Subtask", check_priority=True
+)
+
 
 def register_task_tools(mcp: FastMCP):
     """Register all task-related MCP tools."""
@@ -89,14 +125,9 @@ def register_task_tools(mcp: FastMCP):
         if error:
             return error
 
-        validation_errors = []
-        for i, task_data in enumerate(task_list):
-            if not isinstance(task_data, dict):
-                validation_errors.append(f"Task {i + 1}: Must be a dictionary")
-                continue
-            err = validate_task_data(task_data, i)
-            if err:
-                validation_errors.append(err)
+        validation_errors = [
+            err for err, _ in validate_task_data_batch(task_list) if err
+        ]
 
         if validation_errors:
             return "Validation errors found:\n" + "\n".join(validation_errors)
@@ -106,32 +137,37 @@ def register_task_tools(mcp: FastMCP):
 
         try:
             ticktick = ensure_client()
-            for i, task_data in enumerate(task_list):
-                try:
-                    title = task_data["title"]
-                    result = ticktick.create_task(
-                        title=title,
-                        project_id=task_data["project_id"],
-                        content=task_data.get("content"),
-                        desc=task_data.get("desc"),
-                        start_date=to_ticktick_date_format(task_data.get("start_date")),
-                        due_date=to_ticktick_date_format(task_data.get("due_date")),
-                        time_zone=get_effective_timezone(task_data.get("time_zone")),
-                        priority=normalize_priority(task_data.get("priority", 0)) or 0,
-                        repeat_flag=task_data.get("repeat_flag"),
-                        items=task_data.get("items"),
+            create_task = ticktick.create_task
+            # The fallback timezone is the same for every task in the batch
+            default_tz = get_effective_timezone()
+
+            def send(task_data: Dict[str, Any]) -> Dict:
+                g = task_data.get
+                return create_task(
+                    title=task_data["title"],
+                    project_id=task_data["project_id"],
+                    content=g("content"),
+                    desc=g("desc"),
+                    start_date=to_ticktick_date_format(g("start_date")),
+                    due_date=to_ticktick_date_format(g("due_date")),
+                    time_zone=g("time_zone") or default_tz,
+                    priority=normalize_priority(g("priority", 0)) or 0,
+                    repeat_flag=g("repeat_flag"),
+                    items=g("items"),
+                )
+
+            results = await gather_in_threads(send, task_list, TASK_CONCURRENCY)
+            for i, (task_data, result) in enumerate(zip(task_list, results)):
+                if isinstance(result, Exception):
+                    failed_tasks.append(
+                        f"Task {i + 1} ('{task_data.get('title', 'Unknown')}'): {str(result)}"
                     )
-
-                    if "error" in result:
-                        failed_tasks.append(
-                            f"Task {i + 1} ('{title}'): {result['error']}"
-                        )
-                    else:
-                        created_tasks.append((i + 1, title, result))
-                except Exception as e:
+                elif "error" in result:
                     failed_tasks.append(
-                        f"Task {i + 1} ('{task_data.get('title', 'Unknown')}'): {str(e)}"
+                        f"Task {i + 1} ('{task_data['title']}'): {result['error']}"
                     )
+                else:
+                    created_tasks.append((i + 1, task_data["title"], result))
 
             return format_batch_result(
                 created_tasks,
@@ -186,35 +222,13 @@ def register_task_tools(mcp: FastMCP):
         if error:
             return error
 
-        validation_errors = []
-        for i, task_data in enumerate(task_list):
-            field_errors = validate_required_fields(
-                task_data, ["task_id", "project_id"], i
-            )
-            validation_errors.extend(field_errors)
-            if field_errors:
-                continue
-
-            priority = task_data.get("priority")
-            if priority is not None:
-                priority_error = validate_priority(priority, i)
-                if priority_error:
-                    validation_errors.append(priority_error)
-
-            for date_field in ["start_date", "due_date"]:
-                date_str = task_data.get(date_field)
-                if date_str:
-                    try:
-                        normalized_date = normalize_iso_date(date_str)
-                        dt = datetime.fromisoformat(normalized_date)
-                        if dt.tzinfo is None:
-                            validation_errors.append(
-                                f"Task {i + 1}: {date_field} must include timezone offset (e.g., +08:00 or +0000)"
-                            )
-                    except ValueError:
-                        validation_errors.append(
-                            f"Task {i + 1}: Invalid {date_field} format '{date_str}'"
-                        )
+        # Dates are parsed here, so a bad one rejects the batch before anything
+        # is sent
+        validation_errors = [
+            err
+            for i, task_data in enumerate(task_list)
+            for err in _validate_task_update(task_data, i)
+        ]
 
         if validation_errors:
             return "Validation errors found:\n" + "\n".join(validation_errors)
@@ -224,40 +238,45 @@ def register_task_tools(mcp: FastMCP):
 
         try:
             ticktick = ensure_client()
-            for i, task_data in enumerate(task_list):
-                try:
-                    task_id = task_data["task_id"]
-                    start_date = to_ticktick_date_format(task_data.get("start_date"))
-                    due_date = to_ticktick_date_format(task_data.get("due_date"))
-
-                    time_zone = task_data.get("time_zone")
-                    if not time_zone and (start_date or due_date):
-                        time_zone = get_effective_timezone()
-
-                    result = ticktick.update_task(
-                        task_id=task_id,
-                        project_id=task_data["project_id"],
-                        title=task_data.get("title"),
-                        content=task_data.get("content"),
-                        desc=task_data.get("desc"),
-                        start_date=start_date,
-                        due_date=due_date,
-                        time_zone=time_zone,
-                        priority=normalize_priority(task_data.get("priority")),
-                        repeat_flag=task_data.get("repeat_flag"),
-                        items=task_data.get("items"),
+            update_task = ticktick.update_task
+            # The fallback timezone is the same for every task in the batch
+            default_tz = get_effective_timezone()
+
+            def send(task_data: Dict[str, Any]) -> Dict:
+                g = task_data.get
+                start_date = to_ticktick_date_format(g("start_date"))
+                due_date = to_ticktick_date_format(g("due_date"))
+
+                time_zone = g("time_zone")
+                if not time_zone and (start_date or due_date):
+                    time_zone = default_tz
+
+                return update_task(
+                    task_id=task_data["task_id"],
+                    project_id=task_data["project_id"],
+                    title=g("title"),
+                    content=g("content"),
+                    desc=g("desc"),
+                    start_date=start_date,
+                    due_date=due_date,
+                    time_zone=time_zone,
+                    priority=normalize_priority(g("priority")),
+                    repeat_flag=g("repeat_flag"),
+                    items=g("items"),
+                )
+
+            results = await gather_in_threads(send, task_list, TASK_CONCURRENCY)
+            for i, (task_data, result) in enumerate(zip(task_list, results)):
+                if isinstance(result, Exception):
+                    failed_tasks.append(
+                        f"Task {i + 1} (ID: {task_data.get('task_id', 'Unknown')}): {str(result)}"
                     )
-
-                    if "error" in result:
-                        failed_tasks.append(
-                            f"Task {i + 1} (ID: {task_id}): {result['error']}"
-                        )
-                    else:
-                        updated_tasks.append((i + 1, task_id, result))
-                except Exception as e:
+                elif "error" in result:
                     failed_tasks.append(
-                        f"Task {i + 1} (ID: {task_data.get('task_id', 'Unknown')}): {str(e)}"
+                        f"Task {i + 1} (ID: {task_data['task_id']}): {result['error']}"
                     )
+                else:
+                    updated_tasks.append((i + 1, task_data["task_id"], result))
 
             return format_batch_result(
                 updated_tasks,
@@ -302,11 +321,11 @@ def register_task_tools(mcp: FastMCP):
         if error:
             return error
 
-        validation_errors = []
-        for i, task_data in enumerate(task_list):
-            validation_errors.extend(
-                validate_required_fields(task_data, ["task_id", "project_id"], i)
-            )
+        validation_errors = [
+            err
+            for i, task_data in enumerate(task_list)
+            for err in _validate_task_ref(task_data, i)
+        ]
 
         if validation_errors:
             return "Validation errors found:\n" + "\n".join(validation_errors)
@@ -316,21 +335,25 @@ def register_task_tools(mcp: FastMCP):
 
         try:
             ticktick = ensure_client()
-            for i, task_data in enumerate(task_list):
-                try:
-                    task_id = task_data["task_id"]
-                    result = ticktick.complete_task(task_data["project_id"], task_id)
-
-                    if "error" in result:
-                        failed_tasks.append(
-                            f"Task {i + 1} (ID: {task_id}): {result['error']}"
-                        )
-                    else:
-                        completed_tasks.append((i + 1, task_id))
-                except Exception as e:
+            complete_task = ticktick.complete_task
+            results = await gather_in_threads(
+                lambda task_data: complete_task(
+                    task_data["project_id"], task_data["task_id"]
+                ),
+                task_list,
+                TASK_CONCURRENCY,
+            )
+            for i, (task_data, result) in enumerate(zip(task_list, results)):
+                if isinstance(result, Exception):
                     failed_tasks.append(
-                        f"Task {i + 1} (ID: {task_data.get('task_id', 'Unknown')}): {str(e)}"
+                        f"Task {i + 1} (ID: {task_data.get('task_id', 'Unknown')}): {str(result)}"
                     )
+                elif "error" in result:
+                    failed_tasks.append(
+                        f"Task {i + 1} (ID: {task_data['task_id']}): {result['error']}"
+                    )
+                else:
+                    completed_tasks.append((i + 1, task_data["task_id"]))
 
             return format_batch_result(
                 completed_tasks,
@@ -375,11 +398,11 @@ def register_task_tools(mcp: FastMCP):
         if error:
             return error
 
-        validation_errors = []
-        for i, task_data in enumerate(task_list):
-            validation_errors.extend(
-                validate_required_fields(task_data, ["task_id", "project_id"], i)
-            )
+        validation_errors = [
+            err
+            for i, task_data in enumerate(task_list)
+            for err in _validate_task_ref(task_data, i)
+        ]
 
         if validation_errors:
             return "Validation errors found:\n" + "\n".join(validation_errors)
@@ -389,21 +412,25 @@ def register_task_tools(mcp: FastMCP):
 
         try:
             ticktick = ensure_client()
-            for i, task_data in enumerate(task_list):
-                try:
-                    task_id = task_data["task_id"]
-                    result = ticktick.delete_task(task_data["project_id"], task_id)
-
-                    if "error" in result:
-                        failed_tasks.append(
-                            f"Task {i + 1} (ID: {task_id}): {result['error']}"
-                        )
-                    else:
-                        deleted_tasks.append((i + 1, task_id))
-                except Exception as e:
+            delete_task = ticktick.delete_task
+            results = await gather_in_threads(
+                lambda task_data: delete_task(
+                    task_data["project_id"], task_data["task_id"]
+                ),
+                task_list,
+                TASK_CONCURRENCY,
+            )
+            for i, (task_data, result) in enumerate(zip(task_list, results)):
+                if isinstance(result, Exception):
+                    failed_tasks.append(
+                        f"Task {i + 1} (ID: {task_data.get('task_id', 'Unknown')}): {str(result)}"
+                    )
+                elif "error" in result:
                     failed_tasks.append(
-                        f"Task {i + 1} (ID: {task_data.get('task_id', 'Unknown')}): {str(e)}"
+                        f"Task {i + 1} (ID: {task_data['task_id']}): {result['error']}"
                     )
+                else:
+                    deleted_tasks.append((i + 1, task_data["task_id"]))
 
             return format_batch_result(
                 deleted_tasks,
@@ -450,23 +477,11 @@ def register_task_tools(mcp: FastMCP):
         if error:
             return error
 
-        validation_errors = []
-        for i, subtask_data in enumerate(subtask_list):
-            field_errors = validate_required_fields(
-                subtask_data,
-                ["subtask_title", "parent_task_id", "project_id"],
-                i,
-                "Subtask",
-            )
-            validation_errors.extend(field_errors)
-            if field_errors:
-                continue
-
-            priority = subtask_data.get("priority")
-            if priority is not None:
-                priority_error = validate_priority(priority, i)
-                if priority_error:
-                    validation_errors.append(priority_error.replace("Task", "Subtask"))
+        validation_errors = [
+            err
+            for i, subtask_data in enumerate(subtask_list)
+            for err in _validate_subtask(subtask_data, i)
+        ]
 
         if validation_errors:
             return "Validation errors found:\n" + "\n".join(validation_errors)
@@ -476,28 +491,31 @@ def register_task_tools(mcp: FastMCP):
 
         try:
             ticktick = ensure_client()
-            for i, subtask_data in enumerate(subtask_list):
-                try:
-                    subtask_title = subtask_data["subtask_title"]
-                    result = ticktick.create_subtask(
-                        subtask_title=subtask_title,
-                        parent_task_id=subtask_data["parent_task_id"],
-                        project_id=subtask_data["project_id"],
-                        content=subtask_data.get("content"),
-                        priority=normalize_priority(subtask_data.get("priority", 0))
-                        or 0,
+            create_subtask = ticktick.create_subtask
+
+            def send(subtask_data: Dict[str, Any]) -> Dict:
+                g = subtask_data.get
+                return create_subtask(
+                    subtask_title=subtask_data["subtask_title"],
+                    parent_task_id=subtask_data["parent_task_id"],
+                    project_id=subtask_data["project_id"],
+                    content=g("content"),
+                    priority=normalize_priority(g("priority", 0)) or 0,
+                )
+
+            results = await gather_in_threads(send, subtask_list, TASK_CONCURRENCY)
+            for i, (subtask_data, result) in enumerate(zip(subtask_list, results)):
+                subtask_title = subtask_data.get("subtask_title", "Unknown")
+                if isinstance(result, Exception):
+                    failed_subtasks.append(
+                        f"Subtask {i + 1} ('{subtask_title}'): {str(result)}"
                     )
-
-                    if "error" in result:
-                        failed_subtasks.append(
-                            f"Subtask {i + 1} ('{subtask_title}'): {result['error']}"
-                        )
-                    else:
-                        created_subtasks.append((i + 1, subtask_title, result))
-                except Exception as e:
+                elif "error" in result:
                     failed_subtasks.append(
-                        f"Subtask {i + 1} ('{subtask_data.get('subtask_title', 'Unknown')}'): {str(e)}"
+                        f"Subtask {i + 1} ('{subtask_title}'): {result['error']}"
                     )
+                else:
+                    created_subtasks.append((i + 1, subtask_title, result))
 
             return format_batch_result(
                 created_subtasks,
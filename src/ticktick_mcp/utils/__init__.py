@@ -9,10 +9,13 @@ from .timezone import convert_utc_to_local, normalize_iso_date, get_user_timezon
 from .formatters import format_task, format_project, format_tasks
 from .validators import (
     validate_task_data, 
+    validate_task_data_batch,
     is_task_due_today, 
     is_task_overdue, 
     is_task_due_in_days,
+    get_task_due_date,
     task_matches_search,
+    task_matches_search_lower,
     get_project_tasks_by_filter
 )
 
@@ -30,9 +33,12 @@ __all__ = [
     
     # Validators
     'validate_task_data',
+    'validate_task_data_batch',
     'is_task_due_today',
     'is_task_overdue', 
     'is_task_due_in_days',
+    'get_task_due_date',
     'task_matches_search',
+    'task_matches_search_lower',
     'get_project_tasks_by_filter'
 ]
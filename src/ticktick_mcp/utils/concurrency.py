@@ -0,0 +1,70 @@
+"""
+Concurrency helpers for TickTick MCP.
+
+The TickTick client is synchronous, so batch tools run its calls in worker
+threads; this keeps the event loop free and overlaps the network round trips.
+"""
+
+import asyncio
+from typing import Any, Callable, Dict, Hashable, Iterable, List
+
+# In-flight calls started by run_coalesced, keyed by the caller's key
+_inflight: Dict[Hashable, "asyncio.Future"] = {}
+
+
+async def gather_in_threads(
+    func: Callable[[Any], Any], items: Iterable[Any], limit: int
+) -> List[Any]:
+    """
+    Call func(item) for every item in worker threads, at most `limit` at a time.
+
+    Args:
+        func: Blocking callable taking a single item
+        items: Items to process
+        limit: Maximum number of calls in flight
+
+    Returns:
+        Results in the same order as items. A call that raised is returned as
+        its exception instead of a result.
+    """
+    items = list(items)
+    if len(items) == 1:
+        # Single-item calls are the common case; skip the semaphore and gather
+        try:
+            return [await asyncio.to_thread(func, items[0])]
+        except Exception as e:
+            return [e]
+
+    semaphore = asyncio.Semaphore(limit)
+
+    async def run(item):
+        async with semaphore:
+            return await asyncio.to_thread(func, item)
+
+    return await asyncio.gather(*(run(item) for item in items), return_exceptions=True)
+
+
+async def run_coalesced(key: Hashable, func: Callable[..., Any], *args: Any) -> Any:
+    """
+    Call func(*args) in a worker thread, sharing the call with concurrent callers.
+
+    While a call for `key` is still running, later callers with the same key
+    await its result instead of starting a duplicate request. Once it finishes
+    the key is released, so results are never served after the fact.
+
+    Args:
+        key: Identifies calls that are interchangeable
+        func: Blocking callable to run
+        *args: Arguments for func
+
+    Returns:
+        The result of func(*args); an exception it raised propagates to every
+        caller sharing the call.
+    """
+    future = _inflight.get(key)
+    if future is None:
+        future = asyncio.ensure_future(asyncio.to_thread(func, *args))
+        _inflight[key] = future
+        future.add_done_callback(lambda _: _inflight.pop(key, None))
+    # Shielded so one caller being cancelled doesn't cancel the shared call
+    return await asyncio.shield(future)
@@ -8,21 +8,28 @@ def log_interaction(func: Callable) -> Callable:
     """
     Decorator to wrap MCP tool interactions (formerly for logging, now just error propagation).
     """
+    tool_name = func.__name__
+
     @functools.wraps(func)
     async def wrapper(*args, **kwargs):
-        tool_name = func.__name__
-        
-        logger.info(f"▶️ Tool Call: {tool_name} | Args: {args} | Kwargs: {kwargs}")
+        # Logging is off unless MCP_LOG_ENABLE is set; skip the call entirely then,
+        # and let logging do the %-formatting only if the record is emitted
+        log_info = logger.isEnabledFor(logging.INFO)
+        if log_info:
+            logger.info(
+                "▶️ Tool Call: %s | Args: %s | Kwargs: %s", tool_name, args, kwargs
+            )
             
         try:
             # Execute function
             result = await func(*args, **kwargs)
             
-            logger.info(f"✅ Tool Success: {tool_name}")
+            if log_info:
+                logger.info("✅ Tool Success: %s", tool_name)
             return result
             
         except Exception as e:
-            logger.error(f"❌ Tool Error [{tool_name}] | Error: {str(e)}")
-            raise e
+            logger.error("❌ Tool Error [%s] | Error: %s", tool_name, e)
+            raise
             
     return wrapper
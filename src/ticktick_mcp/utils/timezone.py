@@ -9,6 +9,8 @@ import os
 import re
 import logging
 from datetime import datetime, date
+from functools import lru_cache
+from typing import Optional
 from zoneinfo import ZoneInfo
 
 # Set up logging
@@ -17,6 +19,31 @@ logger = logging.getLogger(__name__)
 # Default timezone configuration
 DEFAULT_TIMEZONE = os.getenv("TICKTICK_DISPLAY_TIMEZONE", "Local")
 
+# Trailing timezone offsets: +HHMM / -HHMM and +HH:MM / -HH:MM
+_TZ_NOCOLON_RE = re.compile(r'([+-])(\d{2})(\d{2})$')
+_TZ_COLON_RE = re.compile(r'([+-])(\d{2}):(\d{2})$')
+
+
+@lru_cache(maxsize=64)
+def _get_zoneinfo(name: str) -> ZoneInfo:
+    """Return the ZoneInfo for an IANA timezone name, reusing earlier lookups."""
+    return ZoneInfo(name)
+
+
+def _resolve_default_zoneinfo() -> Optional[ZoneInfo]:
+    """Resolve DEFAULT_TIMEZONE once; None means use the system local timezone."""
+    if not DEFAULT_TIMEZONE or DEFAULT_TIMEZONE == "Local":
+        return None
+    try:
+        return _get_zoneinfo(DEFAULT_TIMEZONE)
+    except Exception as e:
+        logger.warning(f"Invalid TICKTICK_DISPLAY_TIMEZONE {DEFAULT_TIMEZONE!r}: {e}")
+        return None
+
+
+# Resolved DEFAULT_TIMEZONE, or None for the system local timezone
+_DEFAULT_ZI = _resolve_default_zoneinfo()
+
 
 def convert_utc_to_local(utc_time_str: str, target_timezone: str = None) -> str:
     """
@@ -45,7 +72,7 @@ def convert_utc_to_local(utc_time_str: str, target_timezone: str = None) -> str:
         if target_timezone:
             # 如果指定了时区，尝试使用zoneinfo（Python 3.9+）
             try:
-                local_dt = utc_dt.astimezone(ZoneInfo(target_timezone))
+                local_dt = utc_dt.astimezone(_get_zoneinfo(target_timezone))
                 timezone_name = target_timezone
             except (ImportError, Exception):
                 # 降级到系统本地时区
@@ -88,15 +115,14 @@ def normalize_iso_date(date_str: str) -> str:
     normalized = date_str.replace("Z", "+00:00")
     
     # Handle "+0000" or "-0000" format (add colon before last 2 digits)
-    # Match pattern: ends with +HHMM or -HHMM (4 digits after + or -)
-    # Pattern: ends with + or - followed by exactly 4 digits
-    pattern = r'([+-])(\d{2})(\d{2})$'
-    match = re.search(pattern, normalized)
-    if match:
-        # Replace with format: +HH:MM
-        normalized = re.sub(pattern, r'\1\2:\3', normalized)
-    
-    return normalized
+    # Fast path: ends with +HHMM or -HHMM, splice the colon in directly
+    if len(normalized) >= 5 and normalized[-5] in "+-" and normalized[-4:].isdecimal():
+        return f"{normalized[:-2]}:{normalized[-2:]}"
+    # Fast path: already ends with +HH:MM or -HH:MM
+    if len(normalized) >= 6 and normalized[-6] in "+-" and normalized[-3] == ":":
+        return normalized
+    # Anything else goes through the regex; sub() is a no-op on no match
+    return _TZ_NOCOLON_RE.sub(r'\1\2:\3', normalized)
 
 
 def to_ticktick_date_format(date_str: str) -> str:
@@ -124,20 +150,37 @@ def to_ticktick_date_format(date_str: str) -> str:
     result = date_str.replace("Z", "+0000")
     
     # Remove colon from timezone offset: +08:00 -> +0800, -05:30 -> -0530
-    # Match pattern: ends with +HH:MM or -HH:MM
-    pattern = r'([+-])(\d{2}):(\d{2})$'
-    result = re.sub(pattern, r'\1\2\3', result)
-    
-    return result
+    # Fast path: ends with +HH:MM or -HH:MM, slice the colon out directly
+    if (
+        len(result) >= 6
+        and result[-6] in "+-"
+        and result[-3] == ":"
+        and result[-5:-3].isdecimal()
+        and result[-2:].isdecimal()
+    ):
+        return result[:-3] + result[-2:]
+    # Fast path: already ends with +HHMM or -HHMM
+    if len(result) >= 5 and result[-5] in "+-" and result[-4:].isdecimal():
+        return result
+    # Anything else goes through the regex; sub() is a no-op on no match
+    return _TZ_COLON_RE.sub(r'\1\2\3', result)
+
+
+def get_user_zoneinfo() -> Optional[ZoneInfo]:
+    """Get the user's display timezone, or None to use the system local timezone."""
+    return _DEFAULT_ZI
+
+
+def get_user_timezone_now() -> datetime:
+    """Get the current timezone-aware time in the user's timezone."""
+    if _DEFAULT_ZI is not None:
+        return datetime.now(_DEFAULT_ZI)
+    return datetime.now().astimezone()
 
 
 def get_user_timezone_today() -> date:
     """Get today's date in the user's timezone."""
-    if DEFAULT_TIMEZONE and DEFAULT_TIMEZONE != "Local":
-        try:
-            user_tz = ZoneInfo(DEFAULT_TIMEZONE)
-            return datetime.now(user_tz).date()
-        except Exception:
-            # Fallback to local timezone if user timezone is invalid
-            pass
+    if _DEFAULT_ZI is not None:
+        return datetime.now(_DEFAULT_ZI).date()
+    # Local timezone, also the fallback if the user timezone is invalid
     return datetime.now().date()
@@ -6,11 +6,18 @@ by various criteria, and performing search operations.
 """
 
 import logging
-from datetime import datetime, timedelta
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+from functools import lru_cache
 from typing import Dict, List, Any, Optional, Callable, Union, Tuple
-from zoneinfo import ZoneInfo
 
-from .timezone import normalize_iso_date, get_user_timezone_today, DEFAULT_TIMEZONE
+from .timezone import (
+    normalize_iso_date,
+    get_user_timezone_now,
+    get_user_timezone_today,
+    get_user_zoneinfo,
+    DEFAULT_TIMEZONE,
+)
 from .formatters import format_task, format_project
 
 # Set up logging
@@ -24,6 +31,15 @@ PRIORITY_MAP = {
     "high": 5
 }
 
+# Accepted integer priorities, for hashed membership checks
+_VALID_INT_PRIORITIES = frozenset(PRIORITY_MAP.values())
+
+# Upper bound on concurrent per-project fetches, to avoid stampeding the API
+MAX_CONCURRENT_FETCHES = 8
+
+# User display timezone, resolved once; None means the system local timezone
+_USER_TZ = get_user_zoneinfo()
+
 # Reverse mapping for display purposes
 PRIORITY_NAME_MAP = {
     0: "none",
@@ -48,11 +64,14 @@ def normalize_priority(priority: Union[str, int, None]) -> Optional[int]:
     
     if isinstance(priority, int):
         # Backward compatibility: accept integer directly
-        if priority in [0, 1, 3, 5]:
+        if priority in _VALID_INT_PRIORITIES:
             return priority
         return None
     
     if isinstance(priority, str):
+        # Callers usually pass the canonical lowercase form; skip the case fold
+        if priority in PRIORITY_MAP:
+            return PRIORITY_MAP[priority]
         return PRIORITY_MAP.get(priority.lower())
     
     return None
@@ -73,12 +92,12 @@ def validate_priority(priority: Union[str, int, None], task_index: int) -> Optio
         return None
     
     if isinstance(priority, int):
-        if priority not in [0, 1, 3, 5]:
+        if priority not in _VALID_INT_PRIORITIES:
             return f"Task {task_index + 1}: Invalid priority {priority}. Must be 0, 1, 3, or 5"
         return None
     
     if isinstance(priority, str):
-        if priority.lower() not in PRIORITY_MAP:
+        if priority not in PRIORITY_MAP and priority.lower() not in PRIORITY_MAP:
             valid_values = ", ".join([f'"{k}"' for k in PRIORITY_MAP.keys()])
             return f"Task {task_index + 1}: Invalid priority '{priority}'. Must be one of: {valid_values}"
         return None
@@ -86,116 +105,156 @@ def validate_priority(priority: Union[str, int, None], task_index: int) -> Optio
     return f"Task {task_index + 1}: Priority must be a string or integer"
 
 
-def is_task_due_today(task: Dict[str, Any]) -> bool:
-    """Check if a task is due today."""
-    due_date = task.get('dueDate')
-    if not due_date:
-        return False
+@lru_cache(maxsize=4096)
+def _parse_iso_datetime(date_str: str) -> datetime:
+    """
+    Parse an ISO datetime string in any format normalize_iso_date handles.
     
+    Memoized by the raw string, since the same dates are parsed again and again
+    across queries and batches. Raises ValueError if the string is invalid.
+    """
+    # 使用normalize_iso_date来处理各种日期格式
+    return datetime.fromisoformat(normalize_iso_date(date_str))
+
+
+def _to_user_tz(dt: datetime) -> datetime:
+    """
+    Convert a datetime to the user's timezone, skipping the conversion when
+    its offset already matches (the common case for TickTick due dates).
+    """
+    if _USER_TZ is not None:
+        offset = dt.utcoffset()
+        if offset is not None and offset == _USER_TZ.utcoffset(dt):
+            return dt
+    return dt.astimezone(_USER_TZ)
+
+
+@lru_cache(maxsize=4096)
+def _parse_due_datetime(due_date: str) -> Optional[datetime]:
+    """
+    Parse a TickTick due date string into the user's timezone.
+    
+    Memoized by the raw string: the same tasks are re-filtered on every query,
+    so most due dates have been seen before. Returns None if unparseable.
+    """
     try:
-        # 使用normalize_iso_date来处理各种日期格式
-        normalized_date = normalize_iso_date(due_date)
-        task_due_dt = datetime.fromisoformat(normalized_date)
-        
-        # 将任务截止时间转换为用户时区
-        if DEFAULT_TIMEZONE and DEFAULT_TIMEZONE != "Local":
-            try:
-                user_tz = ZoneInfo(DEFAULT_TIMEZONE)
-                task_due_local = task_due_dt.astimezone(user_tz)
-            except Exception:
-                # Fallback to local timezone
-                task_due_local = task_due_dt.astimezone()
-        else:
-            task_due_local = task_due_dt.astimezone()
-        
-        task_due_date = task_due_local.date()
-        today_date = get_user_timezone_today()
-        return task_due_date == today_date
-    except (ValueError, TypeError):
-        return False
+        # 将任务截止时间转换为用户时区 (None means the local timezone)
+        return _to_user_tz(_parse_iso_datetime(due_date))
+    except (ValueError, TypeError, AttributeError):
+        return None
 
 
-def is_task_overdue(task: Dict[str, Any]) -> bool:
-    """Check if a task is overdue."""
+def get_task_due_date(task: Dict[str, Any]) -> Optional[date]:
+    """Return the task's due date in the user's timezone, or None if it has none."""
     due_date = task.get('dueDate')
     if not due_date:
-        return False
+        return None
     
     try:
-        # 使用normalize_iso_date来处理各种日期格式
-        normalized_date = normalize_iso_date(due_date)
-        task_due = datetime.fromisoformat(normalized_date)
-        
-        # 获取用户时区的当前时间进行比较
-        if DEFAULT_TIMEZONE and DEFAULT_TIMEZONE != "Local":
-            try:
-                user_tz = ZoneInfo(DEFAULT_TIMEZONE)
-                now_user_tz = datetime.now(user_tz)
-                task_due_user_tz = task_due.astimezone(user_tz)
-            except Exception:
-                # Fallback to local timezone
-                now_user_tz = datetime.now()
-                task_due_user_tz = task_due.astimezone()
-        else:
-            now_user_tz = datetime.now()
-            task_due_user_tz = task_due.astimezone()
-        
-        return task_due_user_tz < now_user_tz
-    except (ValueError, TypeError):
+        task_due_local = _parse_due_datetime(due_date)
+    except TypeError:
+        # Unhashable dueDate value
+        return None
+    return task_due_local.date() if task_due_local is not None else None
+
+
+def is_task_due_today(task: Dict[str, Any], today: Optional[date] = None) -> bool:
+    """
+    Check if a task is due today.
+    
+    Pass `today` (the user's current date) when checking many tasks, to avoid
+    looking up the current date for each one.
+    """
+    task_due_date = get_task_due_date(task)
+    if task_due_date is None:
         return False
+    return task_due_date == (today or get_user_timezone_today())
 
 
-def is_task_due_in_days(task: Dict[str, Any], days: int) -> bool:
-    """Check if a task is due in exactly X days."""
+def is_task_overdue(task: Dict[str, Any], now: Optional[datetime] = None) -> bool:
+    """
+    Check if a task is overdue.
+    
+    Pass `now` (a timezone-aware current time) when checking many tasks, to
+    avoid reading the clock for each one.
+    """
     due_date = task.get('dueDate')
     if not due_date:
         return False
     
     try:
-        # 使用normalize_iso_date来处理各种日期格式
-        normalized_date = normalize_iso_date(due_date)
-        task_due_dt = datetime.fromisoformat(normalized_date)
+        task_due_user_tz = _parse_due_datetime(due_date)
+        if task_due_user_tz is None:
+            return False
         
-        # 将任务截止时间转换为用户时区
-        if DEFAULT_TIMEZONE and DEFAULT_TIMEZONE != "Local":
-            try:
-                user_tz = ZoneInfo(DEFAULT_TIMEZONE)
-                task_due_local = task_due_dt.astimezone(user_tz)
-            except Exception:
-                # Fallback to local timezone
-                task_due_local = task_due_dt.astimezone()
-        else:
-            task_due_local = task_due_dt.astimezone()
-        
-        task_due_date = task_due_local.date()
-        target_date = get_user_timezone_today() + timedelta(days=days)
-        return task_due_date == target_date
+        # 获取用户时区的当前时间进行比较
+        return task_due_user_tz < (now or get_user_timezone_now())
     except (ValueError, TypeError):
         return False
 
 
+def is_task_due_in_days(
+    task: Dict[str, Any], days: int, today: Optional[date] = None
+) -> bool:
+    """Check if a task is due in exactly X days. `today` is as for is_task_due_today."""
+    task_due_date = get_task_due_date(task)
+    if task_due_date is None:
+        return False
+    return task_due_date == (today or get_user_timezone_today()) + timedelta(days=days)
+
+
 def task_matches_search(task: Dict[str, Any], search_term: str) -> bool:
     """Check if a task matches the search term (case-insensitive)."""
-    search_term = search_term.lower()
-    
-    # Search in title
-    title = task.get('title', '').lower()
-    if search_term in title:
-        return True
+    return task_matches_search_lower(task, search_term.lower())
+
+
+def task_matches_search_lower(task: Dict[str, Any], search_lower: str) -> bool:
+    """
+    Like task_matches_search, but takes an already-lowercased search term.
     
-    # Search in content
-    content = task.get('content', '').lower()
-    if search_term in content:
-        return True
+    Lets callers filtering many tasks lowercase the term once up front.
+    """
+    # Title, content and subtask titles, lowercased in one pass. The NUL
+    # separator keeps a match from spanning two fields.
+    haystack = "\0".join([
+        task.get('title', ''),
+        task.get('content', ''),
+        *(item.get('title', '') for item in task.get('items', [])),
+    ])
+    return search_lower in haystack.lower()
+
+
+def parse_task_dates(
+    task_data: Dict[str, Any], task_index: int, format_hint: str = ""
+) -> Tuple[List[str], Dict[str, datetime]]:
+    """
+    Parse a task's start_date/due_date, which must include a timezone offset.
     
-    # Search in subtasks
-    items = task.get('items', [])
-    for item in items:
-        item_title = item.get('title', '').lower()
-        if search_term in item_title:
-            return True
+    Args:
+        task_data: Task dictionary
+        task_index: Task index for error messages
+        format_hint: Text appended to invalid-format errors
     
-    return False
+    Returns:
+        Tuple of (one error message per bad date field, parsed datetimes of
+        the dates that are valid)
+    """
+    errors: List[str] = []
+    parsed: Dict[str, datetime] = {}
+    for date_field in ('start_date', 'due_date'):
+        date_str = task_data.get(date_field)
+        if date_str:
+            try:
+                dt = _parse_iso_datetime(date_str)
+            except (ValueError, TypeError, AttributeError):
+                errors.append(f"Task {task_index + 1}: Invalid {date_field} format '{date_str}'{format_hint}")
+                continue
+            # Require explicit tzinfo
+            if dt.tzinfo is None:
+                errors.append(f"Task {task_index + 1}: {date_field} must include timezone offset (e.g., +08:00 or +0000)")
+                continue
+            parsed[date_field] = dt
+    return errors, parsed
 
 
 def validate_task_data(task_data: Dict[str, Any], task_index: int) -> Optional[str]:
@@ -205,38 +264,117 @@ def validate_task_data(task_data: Dict[str, Any], task_index: int) -> Optional[s
     Returns:
         None if valid, error message string if invalid
     """
+    return validate_and_parse_task_data(task_data, task_index)[0]
+
+
+def validate_and_parse_task_data(
+    task_data: Dict[str, Any], task_index: int
+) -> Tuple[Optional[str], Dict[str, datetime]]:
+    """
+    Like validate_task_data, but also return the parsed dates.
+    
+    Returns:
+        Tuple of (error message or None, parsed start_date/due_date datetimes),
+        for callers that need the dates as datetimes rather than strings.
+    """
+    parsed: Dict[str, datetime] = {}
+
     # Check required fields
     if 'title' not in task_data or not task_data['title']:
-        return f"Task {task_index + 1}: 'title' is required and cannot be empty"
+        return f"Task {task_index + 1}: 'title' is required and cannot be empty", parsed
     
     if 'project_id' not in task_data or not task_data['project_id']:
-        return f"Task {task_index + 1}: 'project_id' is required and cannot be empty"
+        return f"Task {task_index + 1}: 'project_id' is required and cannot be empty", parsed
+    
+    # Validate items (subtasks) if provided; cheap, so before date parsing
+    items = task_data.get('items')
+    if items is not None and not isinstance(items, list):
+        return f"Task {task_index + 1}: 'items' must be a list", parsed
     
     # Validate priority if provided
     priority = task_data.get('priority')
     priority_error = validate_priority(priority, task_index)
     if priority_error:
-        return priority_error
+        return priority_error, parsed
     
     # Validate dates if provided (must include timezone offset; no is_all_day flag)
-    for date_field in ['start_date', 'due_date']:
-        date_str = task_data.get(date_field)
-        if date_str:
-            try:
-                normalized_date = normalize_iso_date(date_str)
-                dt = datetime.fromisoformat(normalized_date)
-                # Require explicit tzinfo
-                if dt.tzinfo is None:
-                    return f"Task {task_index + 1}: {date_field} must include timezone offset (e.g., +08:00 or +0000)"
-            except ValueError:
-                return f"Task {task_index + 1}: Invalid {date_field} format '{date_str}'. Use ISO with timezone, e.g., YYYY-MM-DDTHH:mm:ss+0000"
-    
-    # Validate items (subtasks) if provided
-    items = task_data.get('items')
-    if items is not None and not isinstance(items, list):
-        return f"Task {task_index + 1}: 'items' must be a list"
+    date_errors, parsed = parse_task_dates(
+        task_data,
+        task_index,
+        ". Use ISO with timezone, e.g., YYYY-MM-DDTHH:mm:ss+0000",
+    )
+    return (date_errors[0] if date_errors else None), parsed
+
+
+def validate_task_data_batch(
+    task_list: List[Any],
+) -> List[Tuple[Optional[str], Dict[str, datetime]]]:
+    """
+    Validate every task in a batch for creation.
     
-    return None
+    Dates repeated across the batch are parsed once: _parse_iso_datetime is
+    memoized, so each unique date string reaches the parser a single time.
+    
+    Returns:
+        One (error message or None, parsed dates) tuple per task, in order
+    """
+    return [
+        validate_and_parse_task_data(task_data, i)
+        if isinstance(task_data, dict)
+        else (f"Task {i + 1}: Must be a dictionary", {})
+        for i, task_data in enumerate(task_list)
+    ]
+
+
+def _fetch_projects_data(projects: List[Dict], ticktick_client) -> Tuple[List[Dict], Future]:
+    """
+    Fetch project data for each project and the Inbox concurrently.
+    
+    Returns:
+        Tuple of (project data in input order, completed future for the Inbox
+        data). An Inbox failure is left in the future for the caller to report.
+    """
+    project_ids = [project.get('id', 'No ID') for project in projects]
+    get_project_with_data = ticktick_client.get_project_with_data
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_FETCHES) as executor:
+        inbox_future = executor.submit(get_project_with_data, "inbox")
+        project_data_list = list(executor.map(get_project_with_data, project_ids))
+    return project_data_list, inbox_future
+
+
+def count_project_tasks_by_filter(projects: List[Dict], filter_func: Callable, filter_name: str, ticktick_client) -> str:
+    """
+    Count matching tasks across all projects AND Inbox, without formatting them.
+    
+    Takes the same arguments as get_project_tasks_by_filter.
+    
+    Returns:
+        One-line summary of the number of matching tasks
+    """
+    if not projects:
+        return "No projects found."
+    
+    open_projects = [project for project in projects if not project.get('closed')]
+    project_data_list, inbox_future = _fetch_projects_data(open_projects, ticktick_client)
+    count = sum(
+        1
+        for project_data in project_data_list
+        for task in project_data.get('tasks') or []
+        if filter_func(task)
+    )
+    
+    inbox_note = ""
+    try:
+        inbox_data = inbox_future.result()
+        if 'error' not in inbox_data:
+            count += sum(1 for task in inbox_data.get('tasks') or [] if filter_func(task))
+        else:
+            inbox_note = f" Inbox not counted: {inbox_data['error']}"
+    except Exception as e:
+        logger.warning(f"Could not fetch inbox tasks: {e}")
+        inbox_note = f" Inbox not counted (error: {str(e)})"
+    
+    return f"Found {count} tasks ({filter_name}) in {len(open_projects)} projects + Inbox.{inbox_note}"
 
 
 def get_project_tasks_by_filter(projects: List[Dict], filter_func: Callable, filter_name: str, ticktick_client) -> str:
@@ -255,58 +393,58 @@ def get_project_tasks_by_filter(projects: List[Dict], filter_func: Callable, fil
     if not projects:
         return "No projects found."
     
-    result = f"Found {len(projects)} projects + Inbox:\n\n"
+    # Closed projects are skipped, so number and count only the open ones
+    open_projects = [project for project in projects if not project.get('closed')]
+    parts = [f"Found {len(open_projects)} projects + Inbox:\n\n"]
+    
+    project_data_list, inbox_future = _fetch_projects_data(open_projects, ticktick_client)
     
     # Regular projects
-    for i, project in enumerate(projects, 1):
-        if project.get('closed'):
-            continue
-            
-        project_id = project.get('id', 'No ID')
-        project_data = ticktick_client.get_project_with_data(project_id)
-        tasks = project_data.get('tasks', [])
+    projects_with_data = zip(open_projects, project_data_list)
+    for i, (project, project_data) in enumerate(projects_with_data, 1):
+        tasks = project_data.get('tasks') or []
         
         if not tasks:
-            result += f"Project {i}:\n{format_project(project)}"
-            result += f"With 0 tasks that are to be '{filter_name}' in this project :\n\n\n"
+            parts.append(f"Project {i}:\n{format_project(project)}")
+            parts.append(f"With 0 tasks that are to be '{filter_name}' in this project :\n\n\n")
             continue
         
         # Filter tasks using the provided function
-        filtered_tasks = [(t, task) for t, task in enumerate(tasks, 1) if filter_func(task)]
+        filtered_tasks = [task for task in tasks if filter_func(task)]
         
-        result += f"Project {i}:\n{format_project(project)}"
-        result += f"With {len(filtered_tasks)} tasks that are to be '{filter_name}' in this project :\n"
-        
-        for t, task in filtered_tasks:
-            result += f"Task {t}:\n{format_task(task)}\n"
-        
-        result += "\n\n"
+        parts.append(f"Project {i}:\n{format_project(project)}")
+        parts.append(f"With {len(filtered_tasks)} tasks that are to be '{filter_name}' in this project :\n")
+        parts.extend(
+            f"Task {t}:\n{format_task(task)}\n"
+            for t, task in enumerate(filtered_tasks, 1)
+        )
+        parts.append("\n\n")
     
     # Inbox
     try:
-        inbox_data = ticktick_client.get_project_with_data("inbox")
+        inbox_data = inbox_future.result()
         if 'error' not in inbox_data:
             inbox_project = inbox_data.get('project', {}) or {'name': 'Inbox'}
-            inbox_tasks = inbox_data.get('tasks', []) or []
-            
-            filtered_inbox_tasks = [(t, task) for t, task in enumerate(inbox_tasks, 1) if filter_func(task)]
-            
-            result += "Inbox:\n"
-            result += f"Name: {inbox_project.get('name', 'Inbox')}\n"
-            result += "ID: inbox\n"
-            result += f"With {len(filtered_inbox_tasks)} tasks that are to be '{filter_name}' in this project :\n"
+            inbox_tasks = inbox_data.get('tasks') or []
             
-            for t, task in filtered_inbox_tasks:
-                result += f"Task {t}:\n{format_task(task)}\n"
+            filtered_inbox_tasks = [task for task in inbox_tasks if filter_func(task)]
             
-            result += "\n"
+            parts.append("Inbox:\n")
+            parts.append(f"Name: {inbox_project.get('name', 'Inbox')}\n")
+            parts.append("ID: inbox\n")
+            parts.append(f"With {len(filtered_inbox_tasks)} tasks that are to be '{filter_name}' in this project :\n")
+            parts.extend(
+                f"Task {t}:\n{format_task(task)}\n"
+                for t, task in enumerate(filtered_inbox_tasks, 1)
+            )
+            parts.append("\n")
         else:
-            result += f"Inbox: Error fetching inbox: {inbox_data['error']}\n"
+            parts.append(f"Inbox: Error fetching inbox: {inbox_data['error']}\n")
     except Exception as e:
         logger.warning(f"Could not fetch inbox tasks: {e}")
-        result += f"Inbox: Could not fetch (error: {str(e)})\n"
+        parts.append(f"Inbox: Could not fetch (error: {str(e)})\n")
     
-    return result
+    return "".join(parts)
 
 
 # =============================================================================
@@ -367,6 +505,62 @@ def validate_required_fields(
     return errors
 
 
+def make_validator(
+    required_fields: List[str],
+    item_name: str = "Task",
+    check_priority: bool = False,
+    check_dates: bool = False
+) -> Callable[[Any, int], List[str]]:
+    """
+    Build a batch-item validator for a fixed set of required fields.
+    
+    The returned function behaves like validate_required_fields. Once all
+    required fields are present it also validates the optional "priority"
+    field (if check_priority) and parses the optional start_date/due_date
+    (if check_dates), reporting every problem rather than just the first.
+    Everything that depends only on the tool (field list, message prefixes)
+    is resolved here once rather than for every item.
+    
+    Args:
+        required_fields: Field names that must exist in each item
+        item_name: Name of the item type for error messages
+        check_priority: Whether to validate an optional "priority" field
+        check_dates: Whether to validate optional start_date/due_date fields
+    
+    Returns:
+        Function taking (data, index) and returning a list of error messages
+    """
+    required = tuple(required_fields)
+    rename_priority_errors = item_name != "Task"
+    
+    def validate(data: Any, index: int) -> List[str]:
+        if not isinstance(data, dict):
+            return [f"{item_name} {index + 1}: Must be a dictionary"]
+        
+        errors = [
+            f"{item_name} {index + 1}: Missing required field '{field}'"
+            for field in required
+            if field not in data
+        ]
+        if errors:
+            return errors
+        
+        if check_priority:
+            priority = data.get("priority")
+            if priority is not None:
+                priority_error = validate_priority(priority, index)
+                if priority_error:
+                    if rename_priority_errors:
+                        priority_error = priority_error.replace("Task", item_name)
+                    errors.append(priority_error)
+        
+        if check_dates:
+            errors.extend(parse_task_dates(data, index)[0])
+        return errors
+    
+    return validate
+
+
 def get_effective_timezone(provided_tz: Optional[str] = None) -> Optional[str]:
     """
     Get timezone to use, falling back to default if not provided.
@@ -384,6 +578,15 @@ def get_effective_timezone(provided_tz: Optional[str] = None) -> Optional[str]:
     return None
 
 
+# Past tense operation -> (base verb, noun, capitalized past tense)
+_OP_FORMS = {
+    "created": ("create", "creation", "Created"),
+    "updated": ("update", "update", "Updated"),
+    "completed": ("complete", "completion", "Completed"),
+    "deleted": ("delete", "deletion", "Deleted"),
+}
+
+
 def format_batch_result(
     success_list: List[Tuple],
     failed_list: List[str],
@@ -408,31 +611,41 @@ def format_batch_result(
     Returns:
         Formatted result string
     """
+    forms = _OP_FORMS.get(operation)
+    if forms is not None:
+        verb, noun, cap_operation = forms
+    else:
+        # Other operations keep the original derivation from the past tense
+        is_past = operation.endswith('ed')
+        verb = operation.replace('d', '', 1) if is_past else operation
+        noun = operation.replace('ed', 'ion') if is_past else operation
+        cap_operation = operation.capitalize()
+    
     if is_single:
         if success_list:
             if single_success_formatter:
                 return single_success_formatter(success_list[0])
             return f"{item_name.capitalize()} {operation} successfully."
         else:
-            return f"Failed to {operation.replace('d', '', 1) if operation.endswith('ed') else operation} {item_name}:\n{failed_list[0]}"
+            return f"Failed to {verb} {item_name}:\n{failed_list[0]}"
     
     # Batch result
-    result = f"Batch {item_name} {operation.replace('ed', 'ion') if operation.endswith('ed') else operation} completed.\n\n"
-    result += f"Successfully {operation}: {len(success_list)} {item_name}s\n"
-    result += f"Failed: {len(failed_list)} {item_name}s\n\n"
+    parts = [
+        f"Batch {item_name} {noun} completed.\n\n",
+        f"Successfully {operation}: {len(success_list)} {item_name}s\n",
+        f"Failed: {len(failed_list)} {item_name}s\n\n",
+    ]
     
     if success_list:
-        result += f"✅ Successfully {operation.capitalize()} {item_name.capitalize()}s:\n"
-        for item in success_list:
-            if batch_item_formatter:
-                result += batch_item_formatter(item) + "\n"
-            else:
-                result += f"- {item}\n"
-        result += "\n"
+        parts.append(f"✅ Successfully {cap_operation} {item_name.capitalize()}s:\n")
+        if batch_item_formatter:
+            parts.extend(f"{batch_item_formatter(item)}\n" for item in success_list)
+        else:
+            parts.extend(f"- {item}\n" for item in success_list)
+        parts.append("\n")
     
     if failed_list:
-        result += f"❌ Failed {item_name.capitalize()}s:\n"
-        for error in failed_list:
-            result += f"{error}\n"
+        parts.append(f"❌ Failed {item_name.capitalize()}s:\n")
+        parts.extend(f"{error}\n" for error in failed_list)
     
-    return result
+    return "".join(parts)